@@ -0,0 +1,37 @@
+from django.contrib import admin
+
+from airport.models import (
+    Country,
+    City,
+    Facility,
+    Airport,
+    AirplaneType,
+    Airplane,
+    Crew,
+    Route,
+    Flight,
+    Order,
+    Ticket,
+)
+
+
+class TicketInline(admin.TabularInline):
+    model = Ticket
+    extra = 1
+
+
+@admin.register(Order)
+class OrderAdmin(admin.ModelAdmin):
+    inlines = (TicketInline,)
+
+
+admin.site.register(Country)
+admin.site.register(City)
+admin.site.register(Facility)
+admin.site.register(Airport)
+admin.site.register(AirplaneType)
+admin.site.register(Airplane)
+admin.site.register(Crew)
+admin.site.register(Route)
+admin.site.register(Flight)
+admin.site.register(Ticket)
@@ -0,0 +1,30 @@
+import django_filters
+
+from airport.models import Facility, Airport, Flight
+
+
+class AirportFilter(django_filters.FilterSet):
+    name = django_filters.CharFilter(lookup_expr="icontains")
+    closest_big_city = django_filters.CharFilter(
+        field_name="closest_big_city__name", lookup_expr="icontains"
+    )
+    country = django_filters.CharFilter(
+        field_name="closest_big_city__country__name", lookup_expr="icontains"
+    )
+    # the only to-many filter, so distinct is scoped here instead of
+    # applied to every airport queryset
+    facilities = django_filters.ModelMultipleChoiceFilter(
+        queryset=Facility.objects.all(), distinct=True
+    )
+
+    class Meta:
+        model = Airport
+        fields = ("name", "closest_big_city", "country", "facilities")
+
+
+class FlightFilter(django_filters.FilterSet):
+    route = django_filters.NumberFilter()
+
+    class Meta:
+        model = Flight
+        fields = ("route",)
@@ -0,0 +1,18 @@
+# Generated by Django 5.2.17 on 2026-08-30 15:48
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('airport', '0001_initial'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='airport',
+            name='updated_at',
+            field=models.DateTimeField(auto_now=True),
+        ),
+    ]
@@ -0,0 +1,17 @@
+# Generated by Django 5.2.17 on 2026-08-30 15:57
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('airport', '0002_airport_updated_at'),
+    ]
+
+    operations = [
+        migrations.AddConstraint(
+            model_name='ticket',
+            constraint=models.UniqueConstraint(fields=('flight', 'row', 'seat'), name='unique_ticket_seat'),
+        ),
+    ]
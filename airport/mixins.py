@@ -0,0 +1,154 @@
+import hashlib
+
+from django.core.cache import cache
+from django.core.exceptions import FieldDoesNotExist
+from rest_framework import serializers, status
+from rest_framework.response import Response
+
+
+def _resolve_relation(model, source):
+    """Split a serializer source into its leading relation path.
+
+    Returns the relation path in queryset syntax, whether it crosses a
+    to-many relation, and the model at the end of the path — or
+    (None, False, None) when the source does not start with a relation.
+    """
+    path = []
+    many = False
+    current = model
+    for part in source.split("."):
+        try:
+            model_field = current._meta.get_field(part)
+        except FieldDoesNotExist:
+            break
+        if not model_field.is_relation:
+            break
+        path.append(part)
+        many = many or model_field.many_to_many or model_field.one_to_many
+        current = model_field.related_model
+    if not path:
+        return None, False, None
+    return "__".join(path), many, current
+
+
+def eager_loading_paths(model, serializer):
+    """Derive select_related/prefetch_related paths for a serializer.
+
+    Walks the serializer's readable fields, follows sources that start
+    with model relations and recurses into nested serializers. Sources
+    that point at annotations, properties or methods are ignored, so
+    viewsets that feed fields from annotations keep wiring those
+    themselves.
+    """
+    select = set()
+    prefetch = set()
+    for field in serializer.fields.values():
+        if field.write_only:
+            continue
+        source = field.source or ""
+        if not source or source == "*":
+            continue
+        relation, many, related_model = _resolve_relation(model, source)
+        if relation is None:
+            continue
+
+        nested = None
+        if isinstance(field, serializers.ListSerializer):
+            nested = field.child
+        elif isinstance(field, serializers.BaseSerializer):
+            nested = field
+
+        if nested is not None:
+            nested_select, nested_prefetch = eager_loading_paths(
+                related_model, nested
+            )
+        else:
+            nested_select, nested_prefetch = set(), set()
+
+        if many:
+            prefetch.add(relation)
+            prefetch.update(
+                f"{relation}__{path}"
+                for path in nested_select | nested_prefetch
+            )
+        else:
+            select.add(relation)
+            select.update(
+                f"{relation}__{path}" for path in nested_select
+            )
+            prefetch.update(
+                f"{relation}__{path}" for path in nested_prefetch
+            )
+    return select, prefetch
+
+
+class ListETagMixin:
+    """Serve list responses conditionally with an ETag.
+
+    The ETag is derived from a cheap per-viewset fingerprint query plus
+    the request's query string. A matching If-None-Match short-circuits
+    to 304 before the list queryset or serializer run, and the rendered
+    payload is cached per ETag so unchanged data costs one fingerprint
+    query even for clients that do not send the header.
+    """
+
+    etag_cache_timeout = 60 * 60
+
+    def get_list_fingerprint(self):
+        raise NotImplementedError(
+            "ListETagMixin requires get_list_fingerprint()"
+        )
+
+    def list(self, request, *args, **kwargs):
+        fingerprint = (
+            f"{self.basename}:{self.get_list_fingerprint()}"
+            f":{request.GET.urlencode()}"
+        )
+        etag = '"%s"' % hashlib.md5(fingerprint.encode()).hexdigest()
+        cache_key = f"list_payload:{etag}"
+
+        if request.META.get("HTTP_IF_NONE_MATCH") == etag:
+            response = Response(status=status.HTTP_304_NOT_MODIFIED)
+        else:
+            cached_data = cache.get(cache_key)
+            if cached_data is not None:
+                response = Response(cached_data)
+            else:
+                response = super().list(request, *args, **kwargs)
+                cache.set(
+                    cache_key, response.data, self.etag_cache_timeout
+                )
+
+        response["ETag"] = etag
+        response["Vary"] = "Authorization, Accept"
+        return response
+
+
+class EagerLoadingMixin:
+    """Apply serializer-derived eager loading on list/retrieve actions.
+
+    The serializer is built with the request context, so serializers
+    that trim their fields from ?fields= (LimitableSerializer) also
+    trim the derived select_related/prefetch_related.
+    """
+
+    eager_loading_actions = ("list", "retrieve")
+
+    def requested_fields(self):
+        """Return the ?fields= projection as a set, or None if absent."""
+        fields = self.request.query_params.get("fields")
+        if not fields:
+            return None
+        return set(fields.split(","))
+
+    def get_queryset(self):
+        queryset = super().get_queryset()
+        if self.action not in self.eager_loading_actions:
+            return queryset
+        serializer = self.get_serializer()
+        select, prefetch = eager_loading_paths(queryset.model, serializer)
+        if select:
+            queryset = queryset.select_related(*select)
+        if prefetch:
+            queryset = queryset.prefetch_related(*prefetch)
+        return queryset
@@ -0,0 +1,398 @@
+from django.core.cache import cache
+from django.db import IntegrityError, transaction
+from django.db.models import Manager
+from rest_framework import serializers
+from rest_framework.fields import SkipField
+from rest_framework.relations import PKOnlyObject
+
+from airport.models import (
+    Country,
+    City,
+    Facility,
+    Airport,
+    AirplaneType,
+    Airplane,
+    Crew,
+    Route,
+    Flight,
+    Order,
+    Ticket,
+)
+
+
+class FastListSerializer(serializers.ListSerializer):
+    """Render every item through one prepared set of bound child fields.
+
+    The stock ListSerializer calls child.to_representation per item,
+    which re-resolves the readable field set each time. Preparing the
+    bound fields once and looping over plain instances keeps the work
+    per row down to attribute access and field.to_representation.
+    """
+
+    def to_representation(self, data):
+        iterable = data.all() if isinstance(data, Manager) else data
+        fields = list(self.child._readable_fields)
+
+        result = []
+        for instance in iterable:
+            ret = {}
+            for field in fields:
+                try:
+                    attribute = field.get_attribute(instance)
+                except SkipField:
+                    continue
+                check_for_none = (
+                    attribute.pk
+                    if isinstance(attribute, PKOnlyObject)
+                    else attribute
+                )
+                if check_for_none is None:
+                    ret[field.field_name] = None
+                else:
+                    ret[field.field_name] = field.to_representation(
+                        attribute
+                    )
+            result.append(ret)
+        return result
+
+
+class LimitableSerializer(serializers.ModelSerializer):
+    """ModelSerializer whose output can be projected with ?fields=.
+
+    Clients pass ?fields=id,name to receive only those fields; names
+    the serializer does not declare are ignored. Fields are dropped
+    before EagerLoadingMixin inspects the serializer, so trimming a
+    relation field also trims its select_related/prefetch_related.
+    """
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        request = self.context.get("request")
+        if request is None:
+            return
+        requested = request.query_params.get("fields")
+        if not requested:
+            return
+        allowed = set(requested.split(","))
+        for field_name in set(self.fields) - allowed:
+            self.fields.pop(field_name)
+
+
+class CountrySerializer(serializers.ModelSerializer):
+    class Meta:
+        model = Country
+        fields = ("id", "name")
+
+
+class CitySerializer(serializers.ModelSerializer):
+    class Meta:
+        model = City
+        fields = ("id", "name", "country")
+
+
+class CityListSerializer(CitySerializer):
+    country = serializers.CharField(source="country.name", read_only=True)
+
+
+class FacilitySerializer(serializers.ModelSerializer):
+    class Meta:
+        model = Facility
+        fields = ("id", "name")
+
+
+class AirportSerializer(serializers.ModelSerializer):
+    class Meta:
+        model = Airport
+        fields = ("id", "name", "closest_big_city", "facilities")
+
+
+class AirportListSerializer(LimitableSerializer, AirportSerializer):
+    closest_big_city = serializers.CharField(
+        source="closest_big_city.name", read_only=True
+    )
+    country = serializers.CharField(source="country_name", read_only=True)
+    facilities = serializers.SlugRelatedField(
+        many=True, read_only=True, slug_field="name"
+    )
+
+    class Meta:
+        model = Airport
+        fields = ("id", "name", "closest_big_city", "country", "facilities")
+
+    def to_representation(self, instance):
+        # updated_at is part of the key, so a saved airport naturally
+        # misses the stale entry instead of needing explicit
+        # invalidation - signals.py touches it when embedded related
+        # data (city, country, facilities) changes. The projection is
+        # included so a ?fields= hit does not serve a differently
+        # shaped payload
+        cache_key = (
+            f"airport_list:{instance.pk}:{instance.updated_at.timestamp()}"
+            f":{','.join(self.fields)}"
+        )
+        data = cache.get(cache_key)
+        if data is None:
+            data = super(AirportListSerializer, self).to_representation(
+                instance
+            )
+            cache.set(cache_key, data, timeout=60 * 60)
+        return data
+
+
+class AirportDetailSerializer(AirportSerializer):
+    closest_big_city = CityListSerializer(read_only=True)
+    facilities = serializers.SlugRelatedField(
+        many=True, read_only=True, slug_field="name"
+    )
+
+
+class AirplaneTypeSerializer(serializers.ModelSerializer):
+    class Meta:
+        model = AirplaneType
+        fields = ("id", "name")
+
+
+class AirplaneSerializer(serializers.ModelSerializer):
+    class Meta:
+        model = Airplane
+        fields = (
+            "id",
+            "name",
+            "rows",
+            "seats_in_row",
+            "capacity",
+            "airplane_type",
+            "facilities",
+            "image",
+        )
+
+
+class AirplaneListSerializer(AirplaneSerializer):
+    airplane_type = serializers.CharField(
+        source="airplane_type_name", read_only=True
+    )
+    facilities = serializers.SlugRelatedField(
+        many=True, read_only=True, slug_field="name"
+    )
+
+    class Meta(AirplaneSerializer.Meta):
+        list_serializer_class = FastListSerializer
+
+
+class AirplaneDetailSerializer(AirplaneSerializer):
+    airplane_type = AirplaneTypeSerializer(read_only=True)
+    facilities = serializers.SlugRelatedField(
+        many=True, read_only=True, slug_field="name"
+    )
+
+
+class AirplaneImageSerializer(serializers.ModelSerializer):
+    class Meta:
+        model = Airplane
+        fields = ("id", "image")
+
+
+class CrewSerializer(serializers.ModelSerializer):
+    class Meta:
+        model = Crew
+        fields = ("id", "first_name", "last_name", "full_name")
+
+
+class RouteSerializer(serializers.ModelSerializer):
+    class Meta:
+        model = Route
+        fields = ("id", "source", "destination", "distance")
+
+
+class RouteListSerializer(RouteSerializer):
+    source = serializers.CharField(source="source.name", read_only=True)
+    destination = serializers.CharField(
+        source="destination.name", read_only=True
+    )
+
+    class Meta(RouteSerializer.Meta):
+        list_serializer_class = FastListSerializer
+
+
+class RouteDetailSerializer(RouteSerializer):
+    source = AirportDetailSerializer(read_only=True)
+    destination = AirportDetailSerializer(read_only=True)
+
+
+class FlightSerializer(serializers.ModelSerializer):
+    class Meta:
+        model = Flight
+        fields = (
+            "id",
+            "route",
+            "airplane",
+            "crews",
+            "departure_time",
+            "arrival_time",
+        )
+
+
+class FlightListSerializer(LimitableSerializer, FlightSerializer):
+    route = serializers.CharField(source="route_full", read_only=True)
+    airplane = serializers.CharField(source="airplane_name", read_only=True)
+    crews = serializers.SerializerMethodField()
+
+    def get_crews(self, obj):
+        return [crew.full_name for crew in obj.crews.all()]
+
+    class Meta(FlightSerializer.Meta):
+        list_serializer_class = FastListSerializer
+
+
+class FlightDetailSerializer(FlightSerializer):
+    route = RouteDetailSerializer(read_only=True)
+    airplane = AirplaneDetailSerializer(read_only=True)
+    crews = CrewSerializer(many=True, read_only=True)
+
+
+class TicketFlightField(serializers.PrimaryKeyRelatedField):
+    """Resolve flights from the batch preloaded by the list serializer."""
+
+    def to_internal_value(self, data):
+        prefetched = self.context.get("prefetched_flights")
+        if prefetched is not None:
+            try:
+                flight_id = int(data)
+            except (TypeError, ValueError):
+                self.fail("incorrect_type", data_type=type(data).__name__)
+            try:
+                return prefetched[flight_id]
+            except KeyError:
+                self.fail("does_not_exist", pk_value=data)
+        return super(TicketFlightField, self).to_internal_value(data)
+
+
+class TicketListCreateSerializer(serializers.ListSerializer):
+    def to_internal_value(self, data):
+        if isinstance(data, list):
+            flight_ids = set()
+            for item in data:
+                if not isinstance(item, dict):
+                    continue
+                # malformed ids are left for TicketFlightField, which
+                # reports its usual field error instead of a 500 here
+                try:
+                    flight_ids.add(int(item.get("flight")))
+                except (TypeError, ValueError):
+                    continue
+            self.context["prefetched_flights"] = Flight.objects.select_related(
+                "airplane"
+            ).in_bulk(flight_ids)
+        return super(TicketListCreateSerializer, self).to_internal_value(data)
+
+    def validate(self, attrs):
+        for ticket in attrs:
+            Ticket.validate_ticket(
+                ticket["row"],
+                ticket["seat"],
+                ticket["flight"].airplane,
+                serializers.ValidationError,
+            )
+        return attrs
+
+    def create(self, validated_data):
+        # bulk_create skips Ticket.save() (and its full_clean); range
+        # checks run in validate above, and seat collisions - with rows
+        # already booked or inside this payload - are enforced by the
+        # unique_ticket_seat constraint in the same INSERT.
+        try:
+            return Ticket.objects.bulk_create(
+                [Ticket(**ticket_data) for ticket_data in validated_data],
+                batch_size=500,
+            )
+        except IntegrityError:
+            raise serializers.ValidationError(
+                {"seat": "This seat is already taken."}
+            )
+
+
+class TicketSerializer(serializers.ModelSerializer):
+    flight = TicketFlightField(queryset=Flight.objects.all())
+
+    class Meta:
+        model = Ticket
+        fields = ("id", "row", "seat", "flight")
+        list_serializer_class = TicketListCreateSerializer
+        # no auto UniqueTogetherValidator (one exists() per ticket);
+        # the unique_ticket_seat constraint enforces this in the INSERT
+        validators = []
+
+
+class TicketFlightSerializer(FlightSerializer):
+    """Flight summary for nested tickets.
+
+    Reads route.full_way and airplane.name off the instance, unlike
+    FlightListSerializer whose fields come from list-view annotations.
+    """
+
+    route = serializers.CharField(source="route.full_way", read_only=True)
+    airplane = serializers.CharField(source="airplane.name", read_only=True)
+    crews = serializers.SlugRelatedField(
+        many=True, read_only=True, slug_field="full_name"
+    )
+
+
+class TicketListSerializer(TicketSerializer):
+    flight = TicketFlightSerializer(read_only=True)
+
+
+class OrderSerializer(serializers.ModelSerializer):
+    tickets = TicketSerializer(many=True, read_only=False, allow_empty=False)
+
+    class Meta:
+        model = Order
+        fields = ("id", "tickets", "created_at")
+
+    def create(self, validated_data):
+        with transaction.atomic():
+            tickets_data = validated_data.pop("tickets")
+            order = Order.objects.create(**validated_data)
+            self.fields["tickets"].create(
+                [
+                    {**ticket_data, "order": order}
+                    for ticket_data in tickets_data
+                ]
+            )
+            return order
+
+
+class OrderTicketSeatsSerializer(FastListSerializer):
+    """Fetch the seats for a whole page of orders with one values_list."""
+
+    def to_representation(self, data):
+        iterable = data.all() if isinstance(data, Manager) else data
+        if not isinstance(iterable, list):
+            iterable = list(iterable)
+
+        seats = {}
+        for order_id, seat in Ticket.objects.filter(
+            order__in=iterable
+        ).values_list("order_id", "seat"):
+            seats.setdefault(order_id, []).append(seat)
+        self.context["order_seats"] = seats
+
+        return super(OrderTicketSeatsSerializer, self).to_representation(
+            iterable
+        )
+
+
+class OrderListSerializer(OrderSerializer):
+    tickets = serializers.SerializerMethodField()
+
+    class Meta(OrderSerializer.Meta):
+        list_serializer_class = OrderTicketSeatsSerializer
+
+    def get_tickets(self, obj):
+        seats = self.context.get("order_seats")
+        if seats is not None:
+            return seats.get(obj.id, [])
+        return list(obj.tickets.values_list("seat", flat=True))
+
+
+class OrderDetailSerializer(LimitableSerializer, OrderSerializer):
+    tickets = TicketListSerializer(many=True, read_only=True)
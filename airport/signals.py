@@ -0,0 +1,45 @@
+"""Bump Airport.updated_at when embedded related data changes.
+
+The cached airport list payloads (the per-airport entries keyed on
+(pk, updated_at) and the ETag fingerprint built from max(updated_at))
+embed city, country and facility names. Renaming one of those, or
+changing an airport's facilities, does not touch the airport row
+itself, so these receivers touch updated_at on the affected airports
+to rotate both caches.
+"""
+from django.db.models.signals import m2m_changed, post_save
+from django.dispatch import receiver
+from django.utils import timezone
+
+from airport.models import Country, City, Facility, Airport
+
+
+def _touch_airports(queryset):
+    queryset.update(updated_at=timezone.now())
+
+
+@receiver(post_save, sender=Country)
+def country_saved(sender, instance, **kwargs):
+    _touch_airports(
+        Airport.objects.filter(closest_big_city__country=instance)
+    )
+
+
+@receiver(post_save, sender=City)
+def city_saved(sender, instance, **kwargs):
+    _touch_airports(Airport.objects.filter(closest_big_city=instance))
+
+
+@receiver(post_save, sender=Facility)
+def facility_saved(sender, instance, **kwargs):
+    _touch_airports(Airport.objects.filter(facilities=instance))
+
+
+@receiver(m2m_changed, sender=Airport.facilities.through)
+def facilities_changed(sender, instance, action, reverse, pk_set, **kwargs):
+    if action not in ("post_add", "post_remove", "post_clear"):
+        return
+    if reverse:
+        _touch_airports(Airport.objects.filter(pk__in=pk_set or []))
+    else:
+        _touch_airports(Airport.objects.filter(pk=instance.pk))
@@ -0,0 +1,126 @@
+"""Shared sample factories for the airport test suite.
+
+Each helper resolves through get_or_create, so repeated calls with the
+same defaults reuse one row instead of inserting a duplicate per call.
+"""
+from datetime import datetime, timezone
+
+from airport.models import (
+    Country,
+    City,
+    Facility,
+    Airport,
+    AirplaneType,
+    Airplane,
+    Crew,
+    Route,
+    Flight,
+)
+
+
+def sample_country(**params):
+    defaults = {"name": "Ukraine"}
+    defaults.update(params)
+
+    country, _ = Country.objects.get_or_create(**defaults)
+    return country
+
+
+def sample_city(**params):
+    defaults = {"name": "Kyiv"}
+    defaults.update(params)
+    defaults.setdefault("country", sample_country())
+
+    city, _ = City.objects.get_or_create(**defaults)
+    return city
+
+
+def sample_facility(**params):
+    defaults = {"name": "WiFi"}
+    defaults.update(params)
+
+    facility, _ = Facility.objects.get_or_create(**defaults)
+    return facility
+
+
+def sample_facilities(*names):
+    """Create several facilities with a single INSERT."""
+    return Facility.objects.bulk_create(
+        [Facility(name=name) for name in names]
+    )
+
+
+def sample_airport(**params):
+    defaults = {"name": "Boryspil"}
+    defaults.update(params)
+    defaults.setdefault("closest_big_city", sample_city())
+
+    airport, _ = Airport.objects.get_or_create(**defaults)
+    return airport
+
+
+def sample_airports(*names, closest_big_city=None):
+    """Create several airports for one city with a single INSERT."""
+    closest_big_city = closest_big_city or sample_city()
+    return Airport.objects.bulk_create(
+        [
+            Airport(name=name, closest_big_city=closest_big_city)
+            for name in names
+        ]
+    )
+
+
+def sample_airplane_type(**params):
+    defaults = {"name": "Jet"}
+    defaults.update(params)
+
+    airplane_type, _ = AirplaneType.objects.get_or_create(**defaults)
+    return airplane_type
+
+
+def sample_airplane(**params):
+    defaults = {"name": "Boeing 737", "rows": 20, "seats_in_row": 6}
+    defaults.update(params)
+    defaults.setdefault("airplane_type", sample_airplane_type())
+
+    airplane, _ = Airplane.objects.get_or_create(**defaults)
+    return airplane
+
+
+def sample_crew(**params):
+    defaults = {"first_name": "John", "last_name": "Doe"}
+    defaults.update(params)
+
+    crew, _ = Crew.objects.get_or_create(**defaults)
+    return crew
+
+
+def sample_route(**params):
+    defaults = {"distance": 2400}
+    defaults.update(params)
+    defaults.setdefault("source", sample_airport())
+    defaults.setdefault(
+        "destination",
+        sample_airport(
+            name="Heathrow",
+            closest_big_city=sample_city(
+                name="London", country=sample_country(name="UK")
+            ),
+        ),
+    )
+
+    route, _ = Route.objects.get_or_create(**defaults)
+    return route
+
+
+def sample_flight(**params):
+    defaults = {
+        "departure_time": datetime(2023, 6, 2, 14, 0, tzinfo=timezone.utc),
+        "arrival_time": datetime(2023, 6, 2, 18, 0, tzinfo=timezone.utc),
+    }
+    defaults.update(params)
+    defaults.setdefault("route", sample_route())
+    defaults.setdefault("airplane", sample_airplane())
+
+    flight, _ = Flight.objects.get_or_create(**defaults)
+    return flight
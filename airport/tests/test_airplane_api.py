@@ -0,0 +1,221 @@
+import io
+import os
+
+from PIL import Image
+from django.contrib.auth import get_user_model
+from django.core.files.uploadedfile import SimpleUploadedFile
+from django.test import TestCase
+from django.urls import reverse
+from rest_framework import status
+from rest_framework.test import APIClient
+
+from airport.models import Airplane
+from airport.tests.model_samples import (
+    sample_airplane_type,
+    sample_facility,
+    sample_airplane,
+)
+
+AIRPLANE_URL = reverse("airport:airplane-list")
+
+
+def _make_jpeg_bytes():
+    buffer = io.BytesIO()
+    Image.new("RGB", (10, 10)).save(buffer, format="JPEG")
+    return buffer.getvalue()
+
+
+# encoded once at import so each upload test skips the PIL round-trip
+JPEG_CONTENT = _make_jpeg_bytes()
+
+
+def jpeg_upload_file():
+    """In-memory upload wrapping the shared JPEG bytes - no temp file."""
+    return SimpleUploadedFile(
+        "airplane.jpg", JPEG_CONTENT, content_type="image/jpeg"
+    )
+
+
+def detail_url(airplane_id):
+    return reverse("airport:airplane-detail", args=[airplane_id])
+
+
+def image_upload_url(airplane_id):
+    """Return URL for airplane image upload"""
+    return reverse("airport:airplane-upload-image", args=[airplane_id])
+
+
+class UnauthenticatedAirplaneApiTests(TestCase):
+    def setUp(self):
+        self.client = APIClient()
+
+    def test_auth_required(self):
+        res = self.client.get(AIRPLANE_URL)
+
+        self.assertEqual(res.status_code, status.HTTP_401_UNAUTHORIZED)
+
+
+class AuthenticatedAirplaneApiTests(TestCase):
+    @classmethod
+    def setUpTestData(cls):
+        cls.user = get_user_model().objects.create_user(
+            "test@test.com",
+            "testpass",
+        )
+
+    def setUp(self):
+        self.client = APIClient()
+        self.client.force_authenticate(self.user)
+
+    def test_list_airplanes(self):
+        airplane = sample_airplane()
+        airplane.facilities.add(sample_facility())
+        airbus = sample_airplane(
+            name="Airbus A320",
+            airplane_type=sample_airplane_type(name="Airliner"),
+        )
+
+        # airplanes/type join + facilities prefetch
+        with self.assertNumQueries(2):
+            res = self.client.get(AIRPLANE_URL)
+
+        self.assertEqual(res.status_code, status.HTTP_200_OK)
+        self.assertEqual(
+            res.data,
+            [
+                {
+                    "id": airbus.id,
+                    "name": "Airbus A320",
+                    "rows": 20,
+                    "seats_in_row": 6,
+                    "capacity": 120,
+                    "airplane_type": "Airliner",
+                    "facilities": [],
+                    "image": None,
+                },
+                {
+                    "id": airplane.id,
+                    "name": "Boeing 737",
+                    "rows": 20,
+                    "seats_in_row": 6,
+                    "capacity": 120,
+                    "airplane_type": "Jet",
+                    "facilities": ["WiFi"],
+                    "image": None,
+                },
+            ],
+        )
+
+    def test_retrieve_airplane_detail(self):
+        airplane = sample_airplane()
+        airplane.facilities.add(sample_facility())
+
+        res = self.client.get(detail_url(airplane.id))
+
+        self.assertEqual(res.status_code, status.HTTP_200_OK)
+        self.assertEqual(
+            res.data,
+            {
+                "id": airplane.id,
+                "name": "Boeing 737",
+                "rows": 20,
+                "seats_in_row": 6,
+                "capacity": 120,
+                "airplane_type": {
+                    "id": airplane.airplane_type.id,
+                    "name": "Jet",
+                },
+                "facilities": ["WiFi"],
+                "image": None,
+            },
+        )
+
+    def test_create_airplane_forbidden(self):
+        payload = {
+            "name": "Boeing 737",
+            "rows": 20,
+            "seats_in_row": 6,
+            "airplane_type": sample_airplane_type().id,
+        }
+
+        res = self.client.post(AIRPLANE_URL, payload)
+
+        self.assertEqual(res.status_code, status.HTTP_403_FORBIDDEN)
+
+
+class AdminAirplaneApiTests(TestCase):
+    @classmethod
+    def setUpTestData(cls):
+        cls.user = get_user_model().objects.create_user(
+            "admin@admin.com", "testpass", is_staff=True
+        )
+
+    def setUp(self):
+        self.client = APIClient()
+        self.client.force_authenticate(self.user)
+
+    def test_create_airplane(self):
+        airplane_type = sample_airplane_type()
+        payload = {
+            "name": "Boeing 737",
+            "rows": 20,
+            "seats_in_row": 6,
+            "airplane_type": airplane_type.id,
+        }
+
+        res = self.client.post(AIRPLANE_URL, payload)
+
+        self.assertEqual(res.status_code, status.HTTP_201_CREATED)
+
+        airplane = Airplane.objects.get(id=res.data["id"])
+
+        self.assertEqual(airplane.name, payload["name"])
+        self.assertEqual(airplane.capacity, 120)
+
+
+class AirplaneImageUploadTests(TestCase):
+    @classmethod
+    def setUpTestData(cls):
+        cls.user = get_user_model().objects.create_superuser(
+            "admin@myproject.com", "password"
+        )
+
+    def setUp(self):
+        self.client = APIClient()
+        self.client.force_authenticate(self.user)
+        self.airplane = sample_airplane()
+
+    def tearDown(self):
+        self.airplane.image.delete()
+
+    def test_upload_image_to_airplane(self):
+        """Test uploading an image to airplane"""
+        url = image_upload_url(self.airplane.id)
+        res = self.client.post(
+            url, {"image": jpeg_upload_file()}, format="multipart"
+        )
+        self.airplane.refresh_from_db()
+
+        self.assertEqual(res.status_code, status.HTTP_200_OK)
+        self.assertIn("image", res.data)
+        self.assertTrue(os.path.exists(self.airplane.image.path))
+
+    def test_upload_image_bad_request(self):
+        """Test uploading an invalid image"""
+        url = image_upload_url(self.airplane.id)
+        res = self.client.post(
+            url, {"image": "not image"}, format="multipart"
+        )
+
+        self.assertEqual(res.status_code, status.HTTP_400_BAD_REQUEST)
+
+    def test_image_url_is_shown_on_airplane_detail(self):
+        url = image_upload_url(self.airplane.id)
+        self.client.post(
+            url, {"image": jpeg_upload_file()}, format="multipart"
+        )
+        # pick up the stored file so tearDown deletes it
+        self.airplane.refresh_from_db()
+        res = self.client.get(detail_url(self.airplane.id))
+
+        self.assertIn("image", res.data)
@@ -0,0 +1,275 @@
+from django.contrib.auth import get_user_model
+from django.core.cache import cache
+from django.test import TestCase
+from django.urls import reverse
+from rest_framework import status
+from rest_framework.test import APIClient
+
+from airport.models import Airport
+from airport.tests.model_samples import (
+    sample_country,
+    sample_city,
+    sample_facility,
+    sample_facilities,
+    sample_airport,
+    sample_airports,
+)
+
+AIRPORT_URL = reverse("airport:airport-list")
+
+
+def detail_url(airport_id):
+    return reverse("airport:airport-detail", args=[airport_id])
+
+
+class UnauthenticatedAirportApiTests(TestCase):
+    def setUp(self):
+        self.client = APIClient()
+
+    def test_auth_required(self):
+        res = self.client.get(AIRPORT_URL)
+
+        self.assertEqual(res.status_code, status.HTTP_401_UNAUTHORIZED)
+
+
+class AuthenticatedAirportApiTests(TestCase):
+    @classmethod
+    def setUpTestData(cls):
+        cls.user = get_user_model().objects.create_user(
+            "test@test.com",
+            "testpass",
+        )
+
+    def setUp(self):
+        # the ETag payload and per-airport caches are process-wide
+        cache.clear()
+        self.client = APIClient()
+        self.client.force_authenticate(self.user)
+
+    def test_list_airport(self):
+        airport_with_facilities = sample_airport()
+        airport_with_facilities.facilities.add(
+            *sample_facilities("Lounge", "Duty Free")
+        )
+        airport_without_facilities = sample_airport(
+            name="Heathrow",
+            closest_big_city=sample_city(
+                name="London", country=sample_country(name="UK")
+            ),
+        )
+
+        # ETag fingerprint (airports aggregate, cities, facilities)
+        # + airports/city join + facilities prefetch
+        with self.assertNumQueries(5):
+            res = self.client.get(AIRPORT_URL)
+
+        self.assertEqual(res.status_code, status.HTTP_200_OK)
+        self.assertEqual(
+            res.data,
+            [
+                {
+                    "id": airport_with_facilities.id,
+                    "name": "Boryspil",
+                    "closest_big_city": "Kyiv",
+                    "country": "Ukraine",
+                    "facilities": ["Duty Free", "Lounge"],
+                },
+                {
+                    "id": airport_without_facilities.id,
+                    "name": "Heathrow",
+                    "closest_big_city": "London",
+                    "country": "UK",
+                    "facilities": [],
+                },
+            ],
+        )
+
+    def test_list_airport_etag_not_modified(self):
+        sample_airport()
+
+        res = self.client.get(AIRPORT_URL)
+        self.assertIn("ETag", res)
+
+        res = self.client.get(
+            AIRPORT_URL, HTTP_IF_NONE_MATCH=res["ETag"]
+        )
+        self.assertEqual(res.status_code, status.HTTP_304_NOT_MODIFIED)
+
+    def test_list_airport_etag_changes_on_update(self):
+        airport = sample_airport()
+
+        res = self.client.get(AIRPORT_URL)
+        etag = res["ETag"]
+
+        airport.name = "Zhuliany"
+        airport.save()
+
+        res = self.client.get(AIRPORT_URL, HTTP_IF_NONE_MATCH=etag)
+
+        self.assertEqual(res.status_code, status.HTTP_200_OK)
+        self.assertNotEqual(res["ETag"], etag)
+        self.assertEqual(res.data[0]["name"], "Zhuliany")
+
+    def test_list_airport_etag_changes_on_related_rename(self):
+        airport = sample_airport()
+
+        res = self.client.get(AIRPORT_URL)
+        etag = res["ETag"]
+
+        city = airport.closest_big_city
+        city.name = "Lviv"
+        city.save()
+
+        res = self.client.get(AIRPORT_URL, HTTP_IF_NONE_MATCH=etag)
+
+        self.assertEqual(res.status_code, status.HTTP_200_OK)
+        self.assertNotEqual(res["ETag"], etag)
+        self.assertEqual(res.data[0]["closest_big_city"], "Lviv")
+
+    def test_list_airport_cache_invalidated_on_update(self):
+        airport = sample_airport()
+
+        res = self.client.get(AIRPORT_URL)
+        self.assertEqual(res.data[0]["name"], "Boryspil")
+
+        airport.name = "Zhuliany"
+        airport.save()
+
+        res = self.client.get(AIRPORT_URL)
+        self.assertEqual(res.data[0]["name"], "Zhuliany")
+
+    def test_list_airport_cache_invalidated_on_related_rename(self):
+        airport = sample_airport()
+        facility = sample_facility()
+        airport.facilities.add(facility)
+
+        res = self.client.get(AIRPORT_URL)
+        self.assertEqual(res.data[0]["facilities"], ["WiFi"])
+
+        facility.name = "Lounge"
+        facility.save()
+
+        res = self.client.get(AIRPORT_URL)
+        self.assertEqual(res.data[0]["facilities"], ["Lounge"])
+
+    def test_list_airport_limit_fields(self):
+        airport = sample_airport()
+        airport.facilities.add(sample_facility())
+
+        # ETag fingerprint (three queries) + airports; the city join
+        # and facilities prefetch are skipped for the trimmed
+        # projection
+        with self.assertNumQueries(4):
+            res = self.client.get(AIRPORT_URL, {"fields": "id,name"})
+
+        self.assertEqual(res.status_code, status.HTTP_200_OK)
+        self.assertEqual(
+            res.data, [{"id": airport.id, "name": "Boryspil"}]
+        )
+
+    def test_filter_airports_by_name(self):
+        sample_airports("Boryspil", "Zhuliany")
+
+        res = self.client.get(AIRPORT_URL, {"name": "boryspil"})
+
+        self.assertEqual(
+            [airport["name"] for airport in res.data], ["Boryspil"]
+        )
+
+    def test_filter_airports_by_country(self):
+        sample_airport()
+        sample_airport(
+            name="Chopin",
+            closest_big_city=sample_city(
+                name="Warsaw", country=sample_country(name="Poland")
+            ),
+        )
+
+        res = self.client.get(AIRPORT_URL, {"country": "poland"})
+
+        self.assertEqual(
+            [airport["name"] for airport in res.data], ["Chopin"]
+        )
+
+    def test_filter_airports_by_facilities(self):
+        lounge, duty_free = sample_facilities("Lounge", "Duty Free")
+        airport_with_both = sample_airport()
+        airport_with_both.facilities.add(lounge, duty_free)
+        sample_airport(name="Heathrow").facilities.add(lounge)
+        sample_airport(name="Zhuliany")
+
+        res = self.client.get(
+            AIRPORT_URL,
+            {"facilities": [lounge.id, duty_free.id]},
+        )
+
+        # matching both facilities must not duplicate the airport
+        self.assertEqual(
+            [airport["name"] for airport in res.data],
+            ["Boryspil", "Heathrow"],
+        )
+
+    def test_retrieve_airport_detail(self):
+        airport = sample_airport()
+        airport.facilities.add(sample_facility())
+
+        # airport/city/country join + facilities prefetch
+        with self.assertNumQueries(2):
+            res = self.client.get(detail_url(airport.id))
+
+        self.assertEqual(res.status_code, status.HTTP_200_OK)
+        self.assertEqual(
+            res.data,
+            {
+                "id": airport.id,
+                "name": "Boryspil",
+                "closest_big_city": {
+                    "id": airport.closest_big_city.id,
+                    "name": "Kyiv",
+                    "country": "Ukraine",
+                },
+                "facilities": ["WiFi"],
+            },
+        )
+
+    def test_create_airport_forbidden(self):
+        city = sample_city()
+        payload = {
+            "name": "Boryspil",
+            "closest_big_city": city.id,
+        }
+
+        res = self.client.post(AIRPORT_URL, payload)
+
+        self.assertEqual(res.status_code, status.HTTP_403_FORBIDDEN)
+
+
+class AdminAirportApiTests(TestCase):
+    @classmethod
+    def setUpTestData(cls):
+        cls.user = get_user_model().objects.create_user(
+            "admin@admin.com", "testpass", is_staff=True
+        )
+
+    def setUp(self):
+        self.client = APIClient()
+        self.client.force_authenticate(self.user)
+
+    def test_create_airport(self):
+        city = sample_city()
+        facility = sample_facility()
+        payload = {
+            "name": "Boryspil",
+            "closest_big_city": city.id,
+            "facilities": [facility.id],
+        }
+
+        res = self.client.post(AIRPORT_URL, payload)
+
+        self.assertEqual(res.status_code, status.HTTP_201_CREATED)
+
+        airport = Airport.objects.get(id=res.data["id"])
+
+        self.assertEqual(airport.name, payload["name"])
+        self.assertEqual(airport.closest_big_city, city)
+        self.assertIn(facility, airport.facilities.all())
@@ -0,0 +1,176 @@
+from django.contrib.auth import get_user_model
+from django.test import TestCase
+from django.urls import reverse
+from rest_framework import status
+from rest_framework.test import APIClient
+
+from airport.models import Flight
+from airport.tests.model_samples import (
+    sample_country,
+    sample_city,
+    sample_airport,
+    sample_airplane,
+    sample_crew,
+    sample_route,
+    sample_flight,
+)
+
+FLIGHT_URL = reverse("airport:flight-list")
+
+
+def detail_url(flight_id):
+    return reverse("airport:flight-detail", args=[flight_id])
+
+
+class UnauthenticatedFlightApiTests(TestCase):
+    def setUp(self):
+        self.client = APIClient()
+
+    def test_auth_required(self):
+        res = self.client.get(FLIGHT_URL)
+
+        self.assertEqual(res.status_code, status.HTTP_401_UNAUTHORIZED)
+
+
+class AuthenticatedFlightApiTests(TestCase):
+    @classmethod
+    def setUpTestData(cls):
+        cls.user = get_user_model().objects.create_user(
+            "test@test.com",
+            "testpass",
+        )
+
+    def setUp(self):
+        self.client = APIClient()
+        self.client.force_authenticate(self.user)
+
+    def test_list_flights(self):
+        flight = sample_flight()
+        flight.crews.add(sample_crew())
+
+        with self.assertNumQueries(2):
+            res = self.client.get(FLIGHT_URL)
+
+        self.assertEqual(res.status_code, status.HTTP_200_OK)
+        self.assertEqual(
+            res.data,
+            [
+                {
+                    "id": flight.id,
+                    "route": "Boryspil - Heathrow",
+                    "airplane": "Boeing 737",
+                    "crews": ["John Doe"],
+                    "departure_time": "2023-06-02T14:00:00Z",
+                    "arrival_time": "2023-06-02T18:00:00Z",
+                }
+            ],
+        )
+
+    def test_list_flights_limit_fields(self):
+        flight = sample_flight()
+        flight.crews.add(sample_crew())
+
+        # one query: the crews prefetch and route/airplane joins are
+        # skipped for the trimmed projection
+        with self.assertNumQueries(1):
+            res = self.client.get(
+                FLIGHT_URL, {"fields": "id,departure_time"}
+            )
+
+        self.assertEqual(res.status_code, status.HTTP_200_OK)
+        self.assertEqual(
+            list(res.data[0]), ["id", "departure_time"]
+        )
+
+    def test_filter_flights_by_route(self):
+        flight1 = sample_flight()
+        flight2 = sample_flight(
+            route=sample_route(
+                source=sample_airport(
+                    name="Schiphol",
+                    closest_big_city=sample_city(
+                        name="Amsterdam",
+                        country=sample_country(name="Netherlands"),
+                    ),
+                ),
+            ),
+        )
+
+        res = self.client.get(FLIGHT_URL, {"route": flight1.route.id})
+
+        flight_ids = [flight["id"] for flight in res.data]
+
+        self.assertIn(flight1.id, flight_ids)
+        self.assertNotIn(flight2.id, flight_ids)
+
+    def test_filter_flights_by_non_numeric_route(self):
+        sample_flight()
+
+        res = self.client.get(FLIGHT_URL, {"route": "abc"})
+
+        self.assertEqual(res.status_code, status.HTTP_400_BAD_REQUEST)
+
+    def test_retrieve_flight_detail(self):
+        flight = sample_flight()
+        flight.crews.add(sample_crew())
+
+        res = self.client.get(detail_url(flight.id))
+
+        self.assertEqual(res.status_code, status.HTTP_200_OK)
+        self.assertEqual(res.data["route"]["source"]["name"], "Boryspil")
+        self.assertEqual(
+            res.data["route"]["destination"]["name"], "Heathrow"
+        )
+        self.assertEqual(res.data["airplane"]["name"], "Boeing 737")
+        self.assertEqual(
+            [crew["full_name"] for crew in res.data["crews"]],
+            ["John Doe"],
+        )
+
+    def test_create_flight_forbidden(self):
+        route = sample_route()
+        airplane = sample_airplane()
+        payload = {
+            "route": route.id,
+            "airplane": airplane.id,
+            "departure_time": "2023-06-02T14:00:00Z",
+            "arrival_time": "2023-06-02T18:00:00Z",
+        }
+
+        res = self.client.post(FLIGHT_URL, payload)
+
+        self.assertEqual(res.status_code, status.HTTP_403_FORBIDDEN)
+
+
+class AdminFlightApiTests(TestCase):
+    @classmethod
+    def setUpTestData(cls):
+        cls.user = get_user_model().objects.create_user(
+            "admin@admin.com", "testpass", is_staff=True
+        )
+
+    def setUp(self):
+        self.client = APIClient()
+        self.client.force_authenticate(self.user)
+
+    def test_create_flight(self):
+        route = sample_route()
+        airplane = sample_airplane()
+        crew = sample_crew()
+        payload = {
+            "route": route.id,
+            "airplane": airplane.id,
+            "crews": [crew.id],
+            "departure_time": "2023-06-02T14:00:00Z",
+            "arrival_time": "2023-06-02T18:00:00Z",
+        }
+
+        res = self.client.post(FLIGHT_URL, payload)
+
+        self.assertEqual(res.status_code, status.HTTP_201_CREATED)
+
+        flight = Flight.objects.get(id=res.data["id"])
+
+        self.assertEqual(flight.route, route)
+        self.assertEqual(flight.airplane, airplane)
+        self.assertIn(crew, flight.crews.all())
@@ -0,0 +1,40 @@
+from django.test import SimpleTestCase
+
+from airport.mixins import eager_loading_paths
+from airport.models import Airport, Flight
+from airport.serializers import (
+    AirportDetailSerializer,
+    AirportListSerializer,
+    FlightDetailSerializer,
+)
+
+
+class EagerLoadingPathsTests(SimpleTestCase):
+    def test_airport_list_paths(self):
+        select, prefetch = eager_loading_paths(
+            Airport, AirportListSerializer()
+        )
+
+        self.assertEqual(select, {"closest_big_city"})
+        self.assertEqual(prefetch, {"facilities"})
+
+    def test_airport_detail_paths_follow_nested_serializer(self):
+        select, prefetch = eager_loading_paths(
+            Airport, AirportDetailSerializer()
+        )
+
+        self.assertEqual(
+            select, {"closest_big_city", "closest_big_city__country"}
+        )
+        self.assertEqual(prefetch, {"facilities"})
+
+    def test_flight_detail_paths(self):
+        select, prefetch = eager_loading_paths(
+            Flight, FlightDetailSerializer()
+        )
+
+        self.assertIn("route__source__closest_big_city__country", select)
+        self.assertIn("airplane__airplane_type", select)
+        self.assertIn("crews", prefetch)
+        self.assertIn("route__source__facilities", prefetch)
+        self.assertIn("airplane__facilities", prefetch)
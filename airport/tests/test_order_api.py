@@ -0,0 +1,162 @@
+from django.contrib.auth import get_user_model
+from django.test import TestCase
+from django.urls import reverse
+from rest_framework import status
+from rest_framework.test import APIClient
+
+from airport.models import Order, Ticket
+from airport.tests.model_samples import sample_flight
+
+ORDER_URL = reverse("airport:order-list")
+
+
+class UnauthenticatedOrderApiTests(TestCase):
+    def setUp(self):
+        self.client = APIClient()
+
+    def test_auth_required(self):
+        res = self.client.get(ORDER_URL)
+
+        self.assertEqual(res.status_code, status.HTTP_401_UNAUTHORIZED)
+
+
+class AuthenticatedOrderApiTests(TestCase):
+    @classmethod
+    def setUpTestData(cls):
+        cls.user = get_user_model().objects.create_user(
+            "test@test.com",
+            "testpass",
+        )
+
+    def setUp(self):
+        self.client = APIClient()
+        self.client.force_authenticate(self.user)
+
+    def test_list_orders_shows_only_own(self):
+        other_user = get_user_model().objects.create_user(
+            "other@test.com", "testpass"
+        )
+        flight = sample_flight()
+        own_order = Order.objects.create(user=self.user)
+        Ticket.objects.create(row=1, seat=1, flight=flight, order=own_order)
+        other_order = Order.objects.create(user=other_user)
+        Ticket.objects.create(
+            row=1, seat=2, flight=flight, order=other_order
+        )
+
+        # pagination count + orders page + one seats values_list
+        with self.assertNumQueries(3):
+            res = self.client.get(ORDER_URL)
+
+        self.assertEqual(res.status_code, status.HTTP_200_OK)
+        self.assertEqual(len(res.data["results"]), 1)
+        self.assertEqual(res.data["results"][0]["id"], own_order.id)
+        self.assertEqual(res.data["results"][0]["tickets"], [1])
+
+    def test_retrieve_order_detail(self):
+        flight = sample_flight()
+        order = Order.objects.create(user=self.user)
+        Ticket.objects.create(row=1, seat=1, flight=flight, order=order)
+
+        res = self.client.get(
+            reverse("airport:order-detail", args=[order.id])
+        )
+
+        self.assertEqual(res.status_code, status.HTTP_200_OK)
+
+        ticket = res.data["tickets"][0]
+
+        self.assertEqual(ticket["row"], 1)
+        self.assertEqual(ticket["flight"]["route"], "Boryspil - Heathrow")
+
+    def test_create_order(self):
+        flight = sample_flight()
+        payload = {
+            "tickets": [
+                {"row": 1, "seat": 1, "flight": flight.id},
+                {"row": 1, "seat": 2, "flight": flight.id},
+            ]
+        }
+
+        res = self.client.post(ORDER_URL, payload, format="json")
+
+        self.assertEqual(res.status_code, status.HTTP_201_CREATED)
+
+        order = Order.objects.get(id=res.data["id"])
+
+        self.assertEqual(order.user, self.user)
+        self.assertEqual(order.tickets.count(), 2)
+
+    def test_create_order_inserts_tickets_in_bulk(self):
+        flight = sample_flight()
+        payload = {
+            "tickets": [
+                {"row": row, "seat": seat, "flight": flight.id}
+                for row in range(1, 5)
+                for seat in range(1, 7)
+            ]
+        }
+
+        # flights in_bulk + savepoint/release + one INSERT for the order
+        # + one multi-VALUES INSERT for tickets + reading the tickets
+        # back for the response
+        with self.assertNumQueries(6):
+            res = self.client.post(ORDER_URL, payload, format="json")
+
+        self.assertEqual(res.status_code, status.HTTP_201_CREATED)
+        self.assertEqual(
+            Order.objects.get(id=res.data["id"]).tickets.count(), 24
+        )
+
+    def test_create_order_with_taken_seat(self):
+        flight = sample_flight()
+        order = Order.objects.create(user=self.user)
+        Ticket.objects.create(row=1, seat=1, flight=flight, order=order)
+        payload = {
+            "tickets": [{"row": 1, "seat": 1, "flight": flight.id}]
+        }
+
+        res = self.client.post(ORDER_URL, payload, format="json")
+
+        self.assertEqual(res.status_code, status.HTTP_400_BAD_REQUEST)
+
+    def test_create_order_with_duplicate_seat_in_payload(self):
+        flight = sample_flight()
+        payload = {
+            "tickets": [
+                {"row": 1, "seat": 1, "flight": flight.id},
+                {"row": 1, "seat": 1, "flight": flight.id},
+            ]
+        }
+
+        res = self.client.post(ORDER_URL, payload, format="json")
+
+        self.assertEqual(res.status_code, status.HTTP_400_BAD_REQUEST)
+        self.assertEqual(Ticket.objects.count(), 0)
+
+    def test_create_order_with_non_numeric_flight_id(self):
+        sample_flight()
+        payload = {
+            "tickets": [{"row": 1, "seat": 1, "flight": "abc"}]
+        }
+
+        res = self.client.post(ORDER_URL, payload, format="json")
+
+        self.assertEqual(res.status_code, status.HTTP_400_BAD_REQUEST)
+
+    def test_create_order_with_seat_out_of_range(self):
+        flight = sample_flight()
+        payload = {
+            "tickets": [{"row": 1, "seat": 100, "flight": flight.id}]
+        }
+
+        res = self.client.post(ORDER_URL, payload, format="json")
+
+        self.assertEqual(res.status_code, status.HTTP_400_BAD_REQUEST)
+
+    def test_create_order_without_tickets(self):
+        payload = {"tickets": []}
+
+        res = self.client.post(ORDER_URL, payload, format="json")
+
+        self.assertEqual(res.status_code, status.HTTP_400_BAD_REQUEST)
@@ -0,0 +1,31 @@
+from django.urls import path, include
+from rest_framework import routers
+
+from airport.views import (
+    CountryViewSet,
+    CityViewSet,
+    FacilityViewSet,
+    AirportViewSet,
+    AirplaneTypeViewSet,
+    AirplaneViewSet,
+    CrewViewSet,
+    RouteViewSet,
+    FlightViewSet,
+    OrderViewSet,
+)
+
+router = routers.DefaultRouter()
+router.register("countries", CountryViewSet)
+router.register("cities", CityViewSet)
+router.register("facilities", FacilityViewSet)
+router.register("airports", AirportViewSet)
+router.register("airplane_types", AirplaneTypeViewSet)
+router.register("airplanes", AirplaneViewSet)
+router.register("crews", CrewViewSet)
+router.register("routes", RouteViewSet)
+router.register("flights", FlightViewSet)
+router.register("orders", OrderViewSet)
+
+urlpatterns = [path("", include(router.urls))]
+
+app_name = "airport"
@@ -0,0 +1,289 @@
+from django.db.models import Count, F, Max, Prefetch, Value
+from django.db.models.functions import Concat
+from django_filters.rest_framework import DjangoFilterBackend
+from rest_framework import viewsets, mixins, status
+from rest_framework.decorators import action
+from rest_framework.pagination import PageNumberPagination
+from rest_framework.permissions import IsAdminUser, IsAuthenticated
+from rest_framework.response import Response
+
+from airport.models import (
+    Country,
+    City,
+    Facility,
+    Airport,
+    AirplaneType,
+    Airplane,
+    Crew,
+    Route,
+    Flight,
+    Order,
+    Ticket,
+)
+from airport.filters import AirportFilter, FlightFilter
+from airport.mixins import EagerLoadingMixin, ListETagMixin
+from airport.permissions import IsAdminOrIfAuthenticatedReadOnly
+from airport.serializers import (
+    CountrySerializer,
+    CitySerializer,
+    CityListSerializer,
+    FacilitySerializer,
+    AirportSerializer,
+    AirportListSerializer,
+    AirportDetailSerializer,
+    AirplaneTypeSerializer,
+    AirplaneSerializer,
+    AirplaneListSerializer,
+    AirplaneDetailSerializer,
+    AirplaneImageSerializer,
+    CrewSerializer,
+    RouteSerializer,
+    RouteListSerializer,
+    RouteDetailSerializer,
+    FlightSerializer,
+    FlightListSerializer,
+    FlightDetailSerializer,
+    OrderSerializer,
+    OrderListSerializer,
+    OrderDetailSerializer,
+)
+
+
+class CountryViewSet(EagerLoadingMixin, viewsets.ModelViewSet):
+    queryset = Country.objects.all()
+    serializer_class = CountrySerializer
+    permission_classes = (IsAdminOrIfAuthenticatedReadOnly,)
+
+
+class CityViewSet(EagerLoadingMixin, viewsets.ModelViewSet):
+    queryset = City.objects.all()
+    serializer_class = CitySerializer
+    permission_classes = (IsAdminOrIfAuthenticatedReadOnly,)
+
+    def get_serializer_class(self):
+        if self.action in ("list", "retrieve"):
+            return CityListSerializer
+        return CitySerializer
+
+
+class FacilityViewSet(
+    ListETagMixin, EagerLoadingMixin, viewsets.ModelViewSet
+):
+    queryset = Facility.objects.all()
+    serializer_class = FacilitySerializer
+    permission_classes = (IsAdminOrIfAuthenticatedReadOnly,)
+
+    def get_list_fingerprint(self):
+        return str(list(Facility.objects.values_list("id", "name")))
+
+
+class AirportViewSet(
+    ListETagMixin, EagerLoadingMixin, viewsets.ModelViewSet
+):
+    queryset = Airport.objects.all()
+    serializer_class = AirportSerializer
+    permission_classes = (IsAdminOrIfAuthenticatedReadOnly,)
+    filter_backends = (DjangoFilterBackend,)
+    filterset_class = AirportFilter
+
+    def get_list_fingerprint(self):
+        # the payload embeds city, country and facility names, so
+        # renames there have to rotate the ETag as well - otherwise
+        # clients holding the old tag keep getting 304s with stale data
+        aggregate = Airport.objects.aggregate(
+            count=Count("id"), last_updated=Max("updated_at")
+        )
+        cities = list(City.objects.values_list("name", "country__name"))
+        facilities = list(Facility.objects.values_list("id", "name"))
+        return (
+            f"{aggregate['count']}:{aggregate['last_updated']}"
+            f":{cities}:{facilities}"
+        )
+
+    def get_serializer_class(self):
+        if self.action == "list":
+            return AirportListSerializer
+        if self.action == "retrieve":
+            return AirportDetailSerializer
+        return AirportSerializer
+
+    def get_queryset(self):
+        queryset = super().get_queryset()
+
+        if self.action == "list":
+            fields = self.requested_fields()
+            if fields is None or "country" in fields:
+                queryset = queryset.annotate(
+                    country_name=F("closest_big_city__country__name")
+                )
+            only_fields = ["name", "updated_at"]
+            if fields is None or "closest_big_city" in fields:
+                only_fields.append("closest_big_city__name")
+            queryset = queryset.only(*only_fields)
+
+        return queryset
+
+
+class AirplaneTypeViewSet(EagerLoadingMixin, viewsets.ModelViewSet):
+    queryset = AirplaneType.objects.all()
+    serializer_class = AirplaneTypeSerializer
+    permission_classes = (IsAdminOrIfAuthenticatedReadOnly,)
+
+
+class AirplaneViewSet(EagerLoadingMixin, viewsets.ModelViewSet):
+    queryset = Airplane.objects.all()
+    serializer_class = AirplaneSerializer
+    permission_classes = (IsAdminOrIfAuthenticatedReadOnly,)
+
+    def get_serializer_class(self):
+        if self.action == "list":
+            return AirplaneListSerializer
+        if self.action == "retrieve":
+            return AirplaneDetailSerializer
+        if self.action == "upload_image":
+            return AirplaneImageSerializer
+        return AirplaneSerializer
+
+    def get_queryset(self):
+        queryset = super().get_queryset()
+        if self.action == "list":
+            queryset = queryset.annotate(
+                airplane_type_name=F("airplane_type__name")
+            )
+        return queryset
+
+    @action(
+        methods=["POST"],
+        detail=True,
+        url_path="upload-image",
+        permission_classes=[IsAdminUser],
+    )
+    def upload_image(self, request, pk=None):
+        """Endpoint for uploading image to specific airplane"""
+        airplane = self.get_object()
+        serializer = self.get_serializer(airplane, data=request.data)
+
+        if serializer.is_valid():
+            serializer.save()
+            return Response(serializer.data, status=status.HTTP_200_OK)
+
+        return Response(
+            serializer.errors, status=status.HTTP_400_BAD_REQUEST
+        )
+
+
+class CrewViewSet(EagerLoadingMixin, viewsets.ModelViewSet):
+    queryset = Crew.objects.all()
+    serializer_class = CrewSerializer
+    permission_classes = (IsAdminOrIfAuthenticatedReadOnly,)
+
+
+class RouteViewSet(EagerLoadingMixin, viewsets.ModelViewSet):
+    queryset = Route.objects.all()
+    serializer_class = RouteSerializer
+    permission_classes = (IsAdminOrIfAuthenticatedReadOnly,)
+
+    def get_serializer_class(self):
+        if self.action == "list":
+            return RouteListSerializer
+        if self.action == "retrieve":
+            return RouteDetailSerializer
+        return RouteSerializer
+
+    def get_queryset(self):
+        queryset = super().get_queryset()
+        if self.action == "list":
+            queryset = queryset.only(
+                "distance", "source__name", "destination__name"
+            )
+        return queryset
+
+
+class FlightViewSet(EagerLoadingMixin, viewsets.ModelViewSet):
+    queryset = Flight.objects.all()
+    serializer_class = FlightSerializer
+    permission_classes = (IsAdminOrIfAuthenticatedReadOnly,)
+    filter_backends = (DjangoFilterBackend,)
+    filterset_class = FlightFilter
+
+    def get_serializer_class(self):
+        if self.action == "list":
+            return FlightListSerializer
+        if self.action == "retrieve":
+            return FlightDetailSerializer
+        return FlightSerializer
+
+    def get_queryset(self):
+        queryset = super().get_queryset()
+
+        if self.action == "list":
+            fields = self.requested_fields()
+            if fields is None or "crews" in fields:
+                queryset = queryset.prefetch_related(
+                    Prefetch(
+                        "crews",
+                        queryset=Crew.objects.only(
+                            "first_name", "last_name"
+                        ),
+                    )
+                )
+            if fields is None or "route" in fields:
+                queryset = queryset.annotate(
+                    route_full=Concat(
+                        "route__source__name",
+                        Value(" - "),
+                        "route__destination__name",
+                    )
+                )
+            if fields is None or "airplane" in fields:
+                queryset = queryset.annotate(
+                    airplane_name=F("airplane__name")
+                )
+            queryset = queryset.only("departure_time", "arrival_time")
+
+        return queryset.distinct()
+
+
+class OrderPagination(PageNumberPagination):
+    page_size = 10
+    max_page_size = 100
+
+
+class OrderViewSet(
+    mixins.ListModelMixin,
+    mixins.CreateModelMixin,
+    mixins.RetrieveModelMixin,
+    viewsets.GenericViewSet,
+):
+    queryset = Order.objects.all()
+    serializer_class = OrderSerializer
+    pagination_class = OrderPagination
+    permission_classes = (IsAuthenticated,)
+
+    def get_serializer_class(self):
+        if self.action == "list":
+            return OrderListSerializer
+        if self.action == "retrieve":
+            return OrderDetailSerializer
+        return OrderSerializer
+
+    def get_queryset(self):
+        queryset = Order.objects.filter(user=self.request.user)
+        if self.action == "list":
+            queryset = queryset.only("created_at")
+        elif self.action == "retrieve":
+            queryset = queryset.prefetch_related(
+                Prefetch(
+                    "tickets",
+                    queryset=Ticket.objects.select_related(
+                        "flight__route__source",
+                        "flight__route__destination",
+                        "flight__airplane",
+                    ),
+                ),
+                "tickets__flight__crews",
+            )
+        return queryset
+
+    def perform_create(self, serializer):
+        serializer.save(user=self.request.user)
@@ -0,0 +1,10 @@
+"""
+ASGI config for airport_service project.
+"""
+import os
+
+from django.core.asgi import get_asgi_application
+
+os.environ.setdefault("DJANGO_SETTINGS_MODULE", "airport_service.settings")
+
+application = get_asgi_application()
@@ -0,0 +1,10 @@
+"""
+WSGI config for airport_service project.
+"""
+import os
+
+from django.core.wsgi import get_wsgi_application
+
+os.environ.setdefault("DJANGO_SETTINGS_MODULE", "airport_service.settings")
+
+application = get_wsgi_application()